@@ -2,14 +2,39 @@
 import os
 import time
 import csv
+import socket
+import functools
 import requests
-import pandas as pd
+import numpy as np
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+# pandas, pyarrow and plotly are imported inside the analytics functions,
+# so the Chat Interface does not pay their import time
+
+# Optional: Linux file notifications let the file fallback wake as soon as Scala replies
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+# Above this many points a line trace is downsampled before being sent to the browser
+RESAMPLE_THRESHOLD = 10_000
+
+# Function to get plotly-resampler's FigureResampler (optional: only needed for very long daily series)
+@functools.cache
+def _figure_resampler():
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        return None
+    return FigureResampler
+
+# Chat history files
+CONVERSATIONS_DIR = 'conversations/'
+os.makedirs(CONVERSATIONS_DIR, exist_ok=True)
 
 # Function to list all files in the "conversations" folder
+@st.cache_data(ttl=30, show_spinner=False)
 def list_files_in_folder(folder_path):
     files = []
     for file in os.listdir(folder_path):
@@ -17,201 +42,440 @@ def list_files_in_folder(folder_path):
             files.append(file)
     return files
 
+# Connection points shared with the Scala backend
+CONNECTION_DIR = 'src/main/connection/'
+SOCKET_PATH = CONNECTION_DIR + 'moviemate.sock'
+FALLBACK_RESPONSE = "I'm having trouble processing that. Could you try again?"
+
+# Function to connect to the Scala backend's UNIX socket
+def connect_to_scala(timeout):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(SOCKET_PATH)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+# Function to ask the Scala backend over a connected socket, blocking until it replies
+def ask_scala_socket(sock, user_input):
+    with sock:
+        sock.sendall((user_input + '\n').encode('utf-8'))
+        sock.shutdown(socket.SHUT_WR)
+
+        # Scala closes the connection once the full response is written
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b''.join(chunks).decode('utf-8').strip()
+
+# Function to read Scala's reply file, clearing it only if it held a response
+def take_scala_output(output_file):
+    with open(output_file, 'r', encoding='utf-8') as file:
+        scala_output = file.read().strip()
+    if scala_output:
+        with open(output_file, 'w', encoding='utf-8') as clear_file:
+            clear_file.write('')
+    return scala_output
+
+# Function to block until Scala finishes writing its reply file, or the timeout passes
+def wait_for_scala_output(watcher, output_file, timeout):
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not watcher.read(timeout=int(remaining * 1000)):
+            return FALLBACK_RESPONSE
+        # A close-after-write can also be Scala clearing the file, so check for content
+        scala_output = take_scala_output(output_file)
+        if scala_output:
+            return scala_output
+
 # Function to communicate with Scala backend
 def communicate_with_scala(user_input):
     max_retries = 3
     retry_delay = 2
-    input_file = 'src/main/connection/pyinput.txt'
-    output_file = 'src/main/connection/scalaoutput.txt'
+    input_file = CONNECTION_DIR + 'pyinput.txt'
+    output_file = CONNECTION_DIR + 'scalaoutput.txt'
 
+    # Prefer the socket; fall back to file polling if it is unavailable
+    if hasattr(socket, 'AF_UNIX') and os.path.exists(SOCKET_PATH):
+        try:
+            sock = connect_to_scala(max_retries * retry_delay)
+        except OSError:
+            sock = None  # Stale socket or backend without socket support
+        if sock is not None:
+            # Once connected, Scala may already have the request, so never resend it
+            # through the files: an empty reply, timeout or reset gets the fallback message
+            try:
+                return ask_scala_socket(sock, user_input) or FALLBACK_RESPONSE
+            except OSError:
+                return FALLBACK_RESPONSE
+
+    watcher = None
     try:
+        # Watch the reply file before writing input so a fast reply is not missed
+        if inotify_simple is not None and os.path.exists(output_file):
+            watcher = inotify_simple.INotify()
+            watcher.add_watch(output_file, inotify_simple.flags.CLOSE_WRITE)
+
         # Write input
         with open(input_file, 'w', encoding='utf-8') as file:
             file.write(user_input + '\n')
         
+        if watcher is not None:
+            return wait_for_scala_output(watcher, output_file, max_retries * retry_delay)
+
         # Wait and retry logic
         for attempt in range(max_retries):
             time.sleep(retry_delay)  # Wait for Scala to process
             
             try:
-                with open(output_file, 'r', encoding='utf-8') as file:
-                    scala_output = file.read().strip()
-                    if scala_output:
-                        # Only clear the file if we successfully got a response
-                        with open(output_file, 'w', encoding='utf-8') as clear_file:
-                            clear_file.write('')
-                        return scala_output
+                scala_output = take_scala_output(output_file)
+                if scala_output:
+                    return scala_output
             except Exception as e:
                 if attempt == max_retries - 1:  # Last attempt
                     st.error(f"Error reading Scala response: {str(e)}")
-                    return "I'm having trouble processing that. Could you try again?"
+                    return FALLBACK_RESPONSE
                 continue  # Try again if not last attempt
         
-        return "I'm having trouble processing that. Could you try again?"
+        return FALLBACK_RESPONSE
     
     except Exception as e:
         st.error(f"Error communicating with backend: {str(e)}")
-        return "I'm having trouble processing that. Could you try again?"
+        return FALLBACK_RESPONSE
+
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+# Quiz responses logged by the Scala backend, plus a Parquet copy for faster reloads
+QUIZ_CSV = 'quiz_responses.csv'
+QUIZ_PARQUET = 'quiz_responses.parquet'
+QUIZ_COLUMN_TYPES = {
+    'question': 'string',
+    'type': 'string',
+    'user_answer': 'string',
+    'correct_answer': 'string',
+    'is_correct': 'bool',
+    'answered_at': 'timestamp[ns]',
+}
+
+# Daily Statistics table formatting, applied client-side by st.dataframe
+DAILY_STATS_COLUMNS = {
+    'date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+    'success_rate': st.column_config.NumberColumn(format='%.1f%%'),
+    'total_answers': st.column_config.NumberColumn(format='%d'),
+    'questions': st.column_config.NumberColumn(format='%d'),
+}
+
+# Function to map Arrow string columns to Arrow-backed pandas dtypes
+def _arrow_string_dtype(arrow_type):
+    import pandas as pd
+    import pyarrow as pa
+    return pd.ArrowDtype(arrow_type) if pa.types.is_string(arrow_type) else None
+
+# Function to parse the quiz CSV and refresh its Parquet copy, stamped with the CSV's mtime
+def _parse_quiz_csv(csv_mtime):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    # Typed, multithreaded parse; QuizLogger's timestamps are ISO 8601 with a space separator
+    column_types = {name: pa.type_for_alias(alias) for name, alias in QUIZ_COLUMN_TYPES.items()}
+    table = pacsv.read_csv(QUIZ_CSV, convert_options=pacsv.ConvertOptions(column_types=column_types))
+    df = table.to_pandas(types_mapper=_arrow_string_dtype)
+    # Compact dtypes so groupby works on integer codes instead of strings
+    df['type'] = df['type'].astype('category')
+    df['is_correct'] = df['is_correct'].astype(bool)
+    # Day as datetime64 rather than datetime.date objects, stored in the Parquet copy
+    df['date'] = df['answered_at'].dt.floor('D')
+    # Write beside the copy and swap it in, so an interrupted write never leaves a partial file
+    tmp_path = QUIZ_PARQUET + '.tmp'
+    df.to_parquet(tmp_path, engine='pyarrow', index=False)
+    # The stamp is the mtime seen before parsing, so a row appended mid-parse makes the copy stale
+    os.utime(tmp_path, ns=(csv_mtime, csv_mtime))
+    os.replace(tmp_path, QUIZ_PARQUET)
+    return df
+
+# Function to read quiz data, cached per CSV modification time (in ns); only the latest snapshot is kept
+@st.cache_data(show_spinner=False, max_entries=1)
+def _read_quiz_data(csv_mtime):
+    import pandas as pd
+
+    df = None
+    # Reuse the Parquet copy only if it was built from this exact CSV version
+    if os.path.exists(QUIZ_PARQUET) and os.stat(QUIZ_PARQUET).st_mtime_ns == csv_mtime:
+        try:
+            df = pd.read_parquet(QUIZ_PARQUET, engine='pyarrow')
+        except (OSError, ValueError):
+            df = None  # Unreadable copy: rebuild it from the CSV below
+    if df is None:
+        df = _parse_quiz_csv(csv_mtime)
+    # Lets the cached aggregations below identify this snapshot without hashing it
+    df.attrs['csv_mtime'] = csv_mtime
+    return df
 
 # Function to load and process quiz data
 def load_quiz_data():
-    df = pd.read_csv('quiz_responses.csv')
-    df['answered_at'] = pd.to_datetime(df['answered_at'])
-    df['date'] = df['answered_at'].dt.date
-    return df
+    return _read_quiz_data(os.stat(QUIZ_CSV).st_mtime_ns)
 
-def create_quiz_visualizations(df):
-    # Analytics type selector
-    analytics_type = st.selectbox(
-        "Select Analytics View",
-        ["Overall Performance", "Category Performance", "Time Analysis", "Daily Performance"]
+# Cache key for quiz data frames: an O(1) fingerprint instead of hashing every column.
+# The log is append-only, so row count and last timestamp change whenever it does.
+def _quiz_data_key(df):
+    last_answer = df['answered_at'].iloc[-1].value if len(df) else 0
+    return df.attrs.get('csv_mtime'), len(df), last_answer
+
+# Keyed by qualified name so pandas need not be imported here
+QUIZ_HASH_FUNCS = {'pandas.core.frame.DataFrame': _quiz_data_key}
+
+# Function to get per-language stats plus overall correct/total counts in one pass
+@st.cache_data(show_spinner=False, max_entries=1, hash_funcs=QUIZ_HASH_FUNCS)
+def _overall_performance(df):
+    import pandas as pd
+
+    is_correct = df['is_correct']
+    # Classify each quiz type label once, then map rows to a language by their category code
+    labels = df['type'].cat.categories
+    is_en = np.asarray(labels.str.contains('english', case=False, regex=False), dtype=bool)
+    is_ar = np.asarray(labels.str.contains('arabic', case=False, regex=False), dtype=bool)
+    # Codes index ['Arabic', 'English']; -1 (neither language, or a missing type via the
+    # trailing entry) becomes NaN and is dropped by the groupby
+    lang_codes = np.append(np.where(is_en, 1, np.where(is_ar, 0, -1)), -1)
+    language = pd.Categorical.from_codes(
+        lang_codes[df['type'].cat.codes.to_numpy()], categories=['Arabic', 'English']
     )
+    lang_stats = is_correct.groupby(language, observed=True).agg(['count', 'mean'])
+    lang_stats = lang_stats.rename_axis('language').reset_index()
+    # Percentages stay unrounded; labels round when they are formatted
+    lang_stats['percentage'] = lang_stats['mean'].to_numpy(dtype=np.float32) * 100
+    return lang_stats, int(is_correct.sum()), len(df)
 
-    if analytics_type == "Overall Performance":
-        # Enhanced Pie Chart with language type colors
-        # First, get performance by language type
-        lang_performance = df[df['type'].str.contains('english|arabic', case=False)].copy()
-        lang_performance['language'] = lang_performance['type'].apply(
-            lambda x: 'English' if 'english' in x.lower() else 'Arabic'
-        )
-        lang_stats = lang_performance.groupby('language')['is_correct'].agg(['count', 'mean']).reset_index()
-        lang_stats['percentage'] = (lang_stats['mean'] * 100).round(1)
-        
-        # Create pie chart with custom colors
-        fig_lang = go.Figure(data=[go.Pie(
-            labels=lang_stats['language'],
-            values=lang_stats['count'],
-            text=lang_stats['percentage'].apply(lambda x: f'{x}%'),
-            textposition='outside',
-            marker=dict(colors=['#FF9999', '#66B2FF']),
-            textinfo='label+text',
-            hole=0.3
-        )])
-        fig_lang.update_layout(
-            title='Performance by Language',
-            annotations=[dict(text='Language\nDistribution', x=0.5, y=0.5, font_size=12, showarrow=False)]
-        )
-        st.plotly_chart(fig_lang)
+# Function to get answer count and success rate (%) per quiz category
+@st.cache_data(show_spinner=False, max_entries=1, hash_funcs=QUIZ_HASH_FUNCS)
+def _category_perf(df):
+    category_performance = df.groupby('type', observed=True, sort=False, as_index=False)['is_correct'].agg(
+        count='count', mean='mean'
+    )
+    category_performance['mean'] = category_performance['mean'].to_numpy(dtype=np.float32) * 100
+    return category_performance
 
-        # Overall correct vs incorrect
-        correct_answers = df['is_correct'].value_counts()
-        overall_percentage = (df['is_correct'].mean() * 100).round(1)
-        
-        fig_performance = go.Figure(data=[go.Pie(
-            labels=['Correct', 'Incorrect'],
-            values=[correct_answers.get(True, 0), correct_answers.get(False, 0)],
-            text=[f'{overall_percentage}%', f'{(100-overall_percentage)}%'],
-            textposition='outside',
-            marker=dict(colors=['#4ecdc4', '#ff6b6b']),
-            textinfo='label+text',
-            hole=0.3
-        )])
-        fig_performance.update_layout(
-            title='Overall Quiz Performance',
-            annotations=[dict(text='Success\nRate', x=0.5, y=0.5, font_size=12, showarrow=False)]
-        )
-        st.plotly_chart(fig_performance)
+# Function to count responses per hour of day, as (hours, counts) arrays covering all 24 hours
+@st.cache_data(show_spinner=False, max_entries=1, hash_funcs=QUIZ_HASH_FUNCS)
+def _hourly(df):
+    # Rows without a timestamp are skipped, as the groupby did; NaN hours cannot be binned
+    hours = df['answered_at'].dropna().dt.hour.to_numpy()
+    return np.arange(24), np.bincount(hours, minlength=24)
 
-    elif analytics_type == "Category Performance":
-        # Performance by Category
-        category_performance = df.groupby('type')['is_correct'].agg(['count', 'mean']).reset_index()
-        category_performance['mean'] = category_performance['mean'] * 100
-        category_performance['mean'] = category_performance['mean'].round(1)
-        
-        fig_category = go.Figure(data=[
-            go.Bar(
-                x=category_performance['type'],
-                y=category_performance['mean'],
-                text=category_performance['mean'].apply(lambda x: f'{x}%'),
-                textposition='auto',
-                marker_color='#4ecdc4'
-            )
-        ])
-        fig_category.update_layout(
-            title='Performance by Category',
-            xaxis_title='Category',
-            yaxis_title='Correct Answers (%)',
-            yaxis_range=[0, 100]
+# Function to get answer totals and success rate (%) per day
+@st.cache_data(show_spinner=False, max_entries=1, hash_funcs=QUIZ_HASH_FUNCS)
+def _daily(df):
+    # Keep the date sort: the line trace is drawn in row order
+    daily_stats = df.groupby('date', as_index=False).agg(
+        total_answers=('is_correct', 'count'),
+        success_rate=('is_correct', 'mean'),
+        questions=('question', 'count')
+    )
+    daily_stats['success_rate'] = daily_stats['success_rate'].to_numpy(dtype=np.float32) * 100
+    return daily_stats
+
+# Plotly client configs: the pies need no interaction, the category bars need no modebar
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+NO_MODEBAR_CONFIG = {'displayModeBar': False}
+
+# Figure builders, cached so reruns only pay for st.plotly_chart
+# height=None keeps Plotly's default height; each builder keeps one entry per height
+@st.cache_data(show_spinner=False, max_entries=2, hash_funcs=QUIZ_HASH_FUNCS)
+def _build_lang_fig(df, height=None):
+    import plotly.graph_objects as go
+
+    lang_stats, _, _ = _overall_performance(df)
+
+    # Create pie chart with custom colors
+    fig_lang = go.Figure(data=[go.Pie(
+        labels=lang_stats['language'],
+        values=lang_stats['count'],
+        text=[f'{v:.1f}%' for v in lang_stats['percentage'].tolist()],
+        textposition='outside',
+        marker=dict(colors=['#FF9999', '#66B2FF']),
+        textinfo='label+text',
+        hole=0.3
+    )])
+    fig_lang.update_layout(
+        title='Performance by Language',
+        height=height,
+        annotations=[dict(text='Language\nDistribution', x=0.5, y=0.5, font_size=12, showarrow=False)]
+    )
+    return fig_lang
+
+@st.cache_data(show_spinner=False, max_entries=2, hash_funcs=QUIZ_HASH_FUNCS)
+def _build_overall_fig(df, height=None):
+    import plotly.graph_objects as go
+
+    _, correct_count, total = _overall_performance(df)
+    overall_percentage = correct_count * 100 / total if total else 0.0
+
+    fig_performance = go.Figure(data=[go.Pie(
+        labels=['Correct', 'Incorrect'],
+        values=[correct_count, total - correct_count],
+        text=[f'{overall_percentage:.1f}%', f'{100 - overall_percentage:.1f}%'],
+        textposition='outside',
+        marker=dict(colors=['#4ecdc4', '#ff6b6b']),
+        textinfo='label+text',
+        hole=0.3
+    )])
+    fig_performance.update_layout(
+        title='Overall Quiz Performance',
+        height=height,
+        annotations=[dict(text='Success\nRate', x=0.5, y=0.5, font_size=12, showarrow=False)]
+    )
+    return fig_performance
+
+@st.cache_data(show_spinner=False, max_entries=2, hash_funcs=QUIZ_HASH_FUNCS)
+def _build_category_fig(df, height=None):
+    import plotly.graph_objects as go
+
+    category_performance = _category_perf(df)
+
+    fig_category = go.Figure(data=[
+        go.Bar(
+            x=category_performance['type'],
+            y=category_performance['mean'],
+            text=[f'{v:.1f}%' for v in category_performance['mean'].tolist()],
+            textposition='auto',
+            # The float32 percentages are only rounded for display
+            hovertemplate='%{x}<br>%{y:.1f}%<extra></extra>',
+            marker_color='#4ecdc4'
         )
-        st.plotly_chart(fig_category)
+    ])
+    fig_category.update_layout(
+        title='Performance by Category',
+        xaxis_title='Category',
+        yaxis_title='Correct Answers (%)',
+        height=height,
+        yaxis_range=[0, 100]
+    )
+    return fig_category
 
-    elif analytics_type == "Time Analysis":
-        # Response Time Analysis
-        df['hour'] = df['answered_at'].dt.hour
-        hourly_activity = df.groupby('hour')['question'].count().reset_index()
-        
-        fig_time = go.Figure(data=[
-            go.Scatter(
-                x=hourly_activity['hour'],
-                y=hourly_activity['question'],
-                mode='lines+markers',
-                line=dict(color='#4ecdc4'),
-                marker=dict(size=8)
-            )
-        ])
-        fig_time.update_layout(
-            title='Quiz Activity by Hour',
-            xaxis_title='Hour of Day',
-            yaxis_title='Number of Responses',
-            xaxis=dict(tickmode='linear', tick0=0, dtick=1)
+@st.cache_data(show_spinner=False, max_entries=2, hash_funcs=QUIZ_HASH_FUNCS)
+def _build_time_fig(df, height=None):
+    import plotly.graph_objects as go
+
+    hours, counts = _hourly(df)
+
+    fig_time = go.Figure(data=[
+        go.Scattergl(
+            x=hours,
+            y=counts,
+            mode='lines+markers',
+            line=dict(color='#4ecdc4'),
+            marker=dict(size=8)
         )
-        st.plotly_chart(fig_time)
-
-    else:  # Daily Performance
-        # Daily performance analysis
-        daily_stats = df.groupby('date').agg({
-            'is_correct': ['count', 'mean'],
-            'question': 'count'
-        }).reset_index()
-        daily_stats.columns = ['date', 'total_answers', 'success_rate', 'questions']
-        daily_stats['success_rate'] = (daily_stats['success_rate'] * 100).round(1)
-        
-        fig_daily = go.Figure(data=[
-            go.Scatter(
-                x=daily_stats['date'],
-                y=daily_stats['success_rate'],
-                mode='lines+markers',
-                name='Success Rate',
-                line=dict(color='#4ecdc4'),
-                marker=dict(size=8)
-            ),
-            go.Bar(
-                x=daily_stats['date'],
-                y=daily_stats['questions'],
-                name='Number of Questions',
-                marker_color='rgba(158,202,225,0.4)',
-                yaxis='y2'
-            )
-        ])
-        
-        fig_daily.update_layout(
-            title='Daily Performance Overview',
-            xaxis_title='Date',
-            yaxis_title='Success Rate (%)',
-            yaxis2=dict(
-                title='Number of Questions',
-                overlaying='y',
-                side='right'
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+    ])
+    fig_time.update_layout(
+        title='Quiz Activity by Hour',
+        xaxis_title='Hour of Day',
+        yaxis_title='Number of Responses',
+        height=height,
+        xaxis=dict(tickmode='linear', tick0=0, dtick=1)
+    )
+    return fig_time
+
+@st.cache_data(show_spinner=False, max_entries=2, hash_funcs=QUIZ_HASH_FUNCS)
+def _build_daily_fig(df, height=None):
+    import plotly.graph_objects as go
+
+    daily_stats = _daily(df)
+
+    fig_daily = go.Figure(data=[
+        go.Scattergl(
+            x=daily_stats['date'],
+            y=daily_stats['success_rate'],
+            mode='lines+markers',
+            name='Success Rate',
+            hovertemplate='%{x|%Y-%m-%d}<br>%{y:.1f}%',
+            line=dict(color='#4ecdc4'),
+            marker=dict(size=8)
+        ),
+        go.Bar(
+            x=daily_stats['date'],
+            y=daily_stats['questions'],
+            name='Number of Questions',
+            marker_color='rgba(158,202,225,0.4)',
+            yaxis='y2'
         )
-        st.plotly_chart(fig_daily)
-
-        # Display daily statistics table
-        st.subheader("Daily Statistics")
-        st.dataframe(
-            daily_stats.style.format({
-                'success_rate': '{:.1f}%',
-                'total_answers': '{:.0f}',
-                'questions': '{:.0f}'
-            })
+    ])
+    
+    fig_daily.update_layout(
+        title='Daily Performance Overview',
+        xaxis_title='Date',
+        yaxis_title='Success Rate (%)',
+        height=height,
+        yaxis2=dict(
+            title='Number of Questions',
+            overlaying='y',
+            side='right'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
         )
+    )
+    return fig_daily
+
+# Chart name -> (cached figure builder, plotly config)
+CHARTS = {
+    'lang': (_build_lang_fig, STATIC_CHART_CONFIG),
+    'overall': (_build_overall_fig, STATIC_CHART_CONFIG),
+    'category': (_build_category_fig, NO_MODEBAR_CONFIG),
+    'time': (_build_time_fig, {}),
+    'daily': (_build_daily_fig, {}),
+}
+
+# Charts shown by each single-view selection
+ANALYTICS_VIEWS = {
+    "Overall Performance": ['lang', 'overall'],
+    "Category Performance": ['category'],
+    "Time Analysis": ['time'],
+    "Daily Performance": ['daily'],
+}
+
+DASHBOARD_CHART_HEIGHT = 400
+
+# Function to render one chart, sized for the dashboard grid or a single view
+def show_chart(name, df, dashboard=False):
+    builder, config = CHARTS[name]
+    fig = builder(df, height=DASHBOARD_CHART_HEIGHT if dashboard else None)
+    if name == 'daily' and len(_daily(df)) > RESAMPLE_THRESHOLD and _figure_resampler() is not None:
+        fig = _figure_resampler()(fig)
+    if dashboard:
+        st.plotly_chart(fig, use_container_width=True, config=config)
+    else:
+        st.plotly_chart(fig, config=config)
+
+# Function to render the Daily Statistics table
+def show_daily_table(df, dashboard=False):
+    st.subheader("Daily Statistics")
+    if dashboard:
+        st.dataframe(_daily(df), column_config=DAILY_STATS_COLUMNS, use_container_width=True)
+    else:
+        st.dataframe(_daily(df), column_config=DAILY_STATS_COLUMNS)
+
+def create_quiz_visualizations(df):
+    # Analytics type selector
+    analytics_type = st.selectbox("Select Analytics View", list(ANALYTICS_VIEWS))
+
+    for name in ANALYTICS_VIEWS[analytics_type]:
+        show_chart(name, df)
+
+    if analytics_type == "Daily Performance":
+        show_daily_table(df)
 
 # MAIN + STREAMLIT PAGE LAYOUT
 def main():
@@ -240,10 +504,7 @@ def main():
         USER = "user"
         ASSISTANT = "assistant"   
         
-        # Create conversations directory if it doesn't exist
-        conversations_dir = 'conversations/'
-        if not os.path.exists(conversations_dir):
-            os.makedirs(conversations_dir)
+        conversations_dir = CONVERSATIONS_DIR
             
         # Create current chat tracker file if it doesn't exist
         if not os.path.exists(conversations_dir + 'currentchat.txt'):
@@ -259,6 +520,7 @@ def main():
         if len(conversation_files) == 0:
             open(conversations_dir + 'chathistory_0.txt', 'w')
             conversation_files = ['chathistory_0.txt']
+            list_files_in_folder.clear()
 
         # Get current chat file
         with open(conversations_dir + 'currentchat.txt', 'r') as file:
@@ -295,156 +557,28 @@ def main():
             
             with col1:
                 # Language distribution pie chart
-                lang_performance = quiz_data[quiz_data['type'].str.contains('english|arabic', case=False)].copy()
-                lang_performance['language'] = lang_performance['type'].apply(
-                    lambda x: 'English' if 'english' in x.lower() else 'Arabic'
-                )
-                lang_stats = lang_performance.groupby('language')['is_correct'].agg(['count', 'mean']).reset_index()
-                lang_stats['percentage'] = (lang_stats['mean'] * 100).round(1)
-                
-                fig_lang = go.Figure(data=[go.Pie(
-                    labels=lang_stats['language'],
-                    values=lang_stats['count'],
-                    text=lang_stats['percentage'].apply(lambda x: f'{x}%'),
-                    textposition='outside',
-                    marker=dict(colors=['#FF9999', '#66B2FF']),
-                    textinfo='label+text',
-                    hole=0.3
-                )])
-                fig_lang.update_layout(
-                    title='Performance by Language',
-                    height=400,
-                    annotations=[dict(text='Language\nDistribution', x=0.5, y=0.5, font_size=12, showarrow=False)]
-                )
-                st.plotly_chart(fig_lang, use_container_width=True)
+                show_chart('lang', quiz_data, dashboard=True)
 
             with col2:
                 # Overall performance pie chart
-                correct_answers = quiz_data['is_correct'].value_counts()
-                overall_percentage = (quiz_data['is_correct'].mean() * 100).round(1)
-                
-                fig_performance = go.Figure(data=[go.Pie(
-                    labels=['Correct', 'Incorrect'],
-                    values=[correct_answers.get(True, 0), correct_answers.get(False, 0)],
-                    text=[f'{overall_percentage}%', f'{(100-overall_percentage)}%'],
-                    textposition='outside',
-                    marker=dict(colors=['#4ecdc4', '#ff6b6b']),
-                    textinfo='label+text',
-                    hole=0.3
-                )])
-                fig_performance.update_layout(
-                    title='Overall Quiz Performance',
-                    height=400,
-                    annotations=[dict(text='Success\nRate', x=0.5, y=0.5, font_size=12, showarrow=False)]
-                )
-                st.plotly_chart(fig_performance, use_container_width=True)
+                show_chart('overall', quiz_data, dashboard=True)
 
             # Full width for category performance
-            category_performance = quiz_data.groupby('type')['is_correct'].agg(['count', 'mean']).reset_index()
-            category_performance['mean'] = category_performance['mean'] * 100
-            category_performance['mean'] = category_performance['mean'].round(1)
-            
-            fig_category = go.Figure(data=[
-                go.Bar(
-                    x=category_performance['type'],
-                    y=category_performance['mean'],
-                    text=category_performance['mean'].apply(lambda x: f'{x}%'),
-                    textposition='auto',
-                    marker_color='#4ecdc4'
-                )
-            ])
-            fig_category.update_layout(
-                title='Performance by Category',
-                xaxis_title='Category',
-                yaxis_title='Correct Answers (%)',
-                height=400,
-                yaxis_range=[0, 100]
-            )
-            st.plotly_chart(fig_category, use_container_width=True)
+            show_chart('category', quiz_data, dashboard=True)
 
             # Create two columns for time-based analytics
             col3, col4 = st.columns(2)
             
             with col3:
                 # Hourly activity
-                quiz_data['hour'] = quiz_data['answered_at'].dt.hour
-                hourly_activity = quiz_data.groupby('hour')['question'].count().reset_index()
-                
-                fig_time = go.Figure(data=[
-                    go.Scatter(
-                        x=hourly_activity['hour'],
-                        y=hourly_activity['question'],
-                        mode='lines+markers',
-                        line=dict(color='#4ecdc4'),
-                        marker=dict(size=8)
-                    )
-                ])
-                fig_time.update_layout(
-                    title='Quiz Activity by Hour',
-                    xaxis_title='Hour of Day',
-                    yaxis_title='Number of Responses',
-                    height=400,
-                    xaxis=dict(tickmode='linear', tick0=0, dtick=1)
-                )
-                st.plotly_chart(fig_time, use_container_width=True)
+                show_chart('time', quiz_data, dashboard=True)
 
             with col4:
                 # Daily performance
-                daily_stats = quiz_data.groupby('date').agg({
-                    'is_correct': ['count', 'mean'],
-                    'question': 'count'
-                }).reset_index()
-                daily_stats.columns = ['date', 'total_answers', 'success_rate', 'questions']
-                daily_stats['success_rate'] = (daily_stats['success_rate'] * 100).round(1)
-                
-                fig_daily = go.Figure(data=[
-                    go.Scatter(
-                        x=daily_stats['date'],
-                        y=daily_stats['success_rate'],
-                        mode='lines+markers',
-                        name='Success Rate',
-                        line=dict(color='#4ecdc4'),
-                        marker=dict(size=8)
-                    ),
-                    go.Bar(
-                        x=daily_stats['date'],
-                        y=daily_stats['questions'],
-                        name='Number of Questions',
-                        marker_color='rgba(158,202,225,0.4)',
-                        yaxis='y2'
-                    )
-                ])
-                
-                fig_daily.update_layout(
-                    title='Daily Performance Overview',
-                    xaxis_title='Date',
-                    yaxis_title='Success Rate (%)',
-                    height=400,
-                    yaxis2=dict(
-                        title='Number of Questions',
-                        overlaying='y',
-                        side='right'
-                    ),
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
-                )
-                st.plotly_chart(fig_daily, use_container_width=True)
+                show_chart('daily', quiz_data, dashboard=True)
 
             # Display daily statistics table at the bottom
-            st.subheader("Daily Statistics")
-            st.dataframe(
-                daily_stats.style.format({
-                    'success_rate': '{:.1f}%',
-                    'total_answers': '{:.0f}',
-                    'questions': '{:.0f}'
-                }),
-                use_container_width=True
-            )
+            show_daily_table(quiz_data, dashboard=True)
 
         except Exception as e:
             st.error(f"Error loading quiz data: {str(e)}")
@@ -7,6 +7,9 @@ import scala.util.{Try, Success, Failure}
 import java.io.{File, PrintWriter, FileWriter, BufferedWriter}
 import scala.io.StdIn.readLine
 import java.nio.file.{Files, Paths, StandardOpenOption}
+import java.net.{StandardProtocolFamily, UnixDomainSocketAddress}
+import java.nio.channels.{Channels, ServerSocketChannel}
+import java.nio.charset.StandardCharsets
 import com.github.tototoshi.csv._
 import java.io.File
 import play.api.libs.json._
@@ -673,6 +676,49 @@ object MovieChatbot:
       case Success(_) => 
         println("Movie chatbot is running in file communication mode...")
   
+  private var lastResponse: Response = Response(ResponseType.Greeting, "Hello! I'm your movie recommendation bot. How can I help you today?")
+
+  // Both channels share the same conversation state, so responses are serialized
+  private def respondTo(bot: MovieChatbot, input: String): String = synchronized {
+    val response = bot.respond(input, lastResponse)
+    lastResponse = response
+    response.message
+  }
+
+  private def setupSocketCommunication(bot: MovieChatbot, connectionDir: String): Unit = {
+    // One request per connection: the client sends its message and shuts down writing, we reply and close
+    val socketPath = Paths.get(s"$connectionDir/moviemate.sock")
+    Files.deleteIfExists(socketPath)
+    val server = ServerSocketChannel.open(StandardProtocolFamily.UNIX)
+    server.bind(UnixDomainSocketAddress.of(socketPath))
+    socketPath.toFile.deleteOnExit()
+
+    val listener = new Thread(() => {
+      while (true) {
+        val client = server.accept()
+        try {
+          // Read to EOF so multi-line chat messages arrive whole, as on the file channel
+          val input = new String(Channels.newInputStream(client).readAllBytes(), StandardCharsets.UTF_8).trim
+          if (input.nonEmpty) {
+            println(s"Received input: $input")
+            val message = respondTo(bot, input)
+            val out = Channels.newOutputStream(client)
+            out.write(message.getBytes(StandardCharsets.UTF_8))
+            out.flush()
+            println(s"Sent response: $message")
+          }
+        } catch {
+          case e: Exception =>
+            println(s"Error in socket communication: ${e.getMessage}")
+        } finally {
+          client.close()
+        }
+      }
+    })
+    listener.setDaemon(true)
+    listener.start()
+  }
+
   private def setupFileCommunication(bot: MovieChatbot): Unit = {
     // Create directory if it doesn't exist
     val connectionDir = "src/main/connection"
@@ -688,7 +734,16 @@ object MovieChatbot:
       new PrintWriter(inputFile) { write(""); close() }
     }
     
-    var lastResponse: Response = Response(ResponseType.Greeting, "Hello! I'm your movie recommendation bot. How can I help you today?")
+    // Socket channel for the Python frontend; the file loop below stays as a fallback
+    // UNIX domain sockets need JDK 16+; on older runtimes the classes fail to link,
+    // which Try would rethrow as fatal, so check the version before touching them
+    if (Runtime.version().feature() < 16) {
+      println("Socket communication needs JDK 16+, using files only")
+    } else {
+      Try(setupSocketCommunication(bot, connectionDir)) match
+        case Failure(e) => println(s"Socket communication unavailable, using files only: ${e.getMessage}")
+        case Success(_) => println("Listening for socket connections...")
+    }
     
     // Setup file monitoring loop
     while (true) {
@@ -701,15 +756,14 @@ object MovieChatbot:
           new PrintWriter(inputFile) { write(""); close() }
           
           // Process input
-          val response = bot.respond(inputContent, lastResponse)
-          lastResponse = response
+          val message = respondTo(bot, inputContent)
           
           // Write response to output file
           val writer = new PrintWriter(new FileWriter(outputFile))
-          writer.write(response.message)
+          writer.write(message)
           writer.close()
           
-          println(s"Sent response: ${response.message}")
+          println(s"Sent response: $message")
         }
         
         // Pause before checking for new input